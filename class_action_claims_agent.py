@@ -15,14 +15,31 @@ Features:
 """
 
 import argparse
+import hashlib
+import io
 import json
 import os
-import smtplib
 from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Mapping
 from datetime import datetime, timedelta
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Dict, Any, Iterator, Optional, Tuple
+
+if TYPE_CHECKING:
+    import smtplib
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ciso8601
+    HAS_CISO8601 = True
+except ImportError:
+    HAS_CISO8601 = False
 
 
 # ============================================================================
@@ -30,7 +47,7 @@ from typing import List, Dict, Any, Optional
 # ============================================================================
 
 # Popular class action claims sources/categories
-CLAIMS_CATEGORIES = [
+CLAIMS_CATEGORIES = (
     "data_breach",
     "consumer_products",
     "securities",
@@ -39,7 +56,7 @@ CLAIMS_CATEGORIES = [
     "insurance",
     "automotive",
     "telecommunications"
-]
+)
 
 # Default configuration
 DEFAULT_STATE_FILE = "class_action_state.json"
@@ -47,16 +64,62 @@ DEFAULT_EXPIRING_WINDOW_DAYS = 30
 DEFAULT_RECENT_PAYOUT_WINDOW_DAYS = 30
 
 
+# ============================================================================
+# SERIALIZATION HELPERS
+# ============================================================================
+
+def _dumps_state(data: Dict[str, Any], pretty: bool = False) -> bytes:
+    """Serialize state or report data to UTF-8 JSON, using orjson when it is installed.
+
+    Output is compact unless pretty is set, which indents for human reading.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2) if pretty else orjson.dumps(data)
+    if pretty:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _loads_state(raw: bytes) -> Dict[str, Any]:
+    """Parse state JSON, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=8192)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp, memoized since dates repeat across records and runs."""
+    if HAS_CISO8601:
+        return ciso8601.parse_datetime(value)
+    return datetime.fromisoformat(value)
+
+
+def _state_content_hash(state: Dict[str, Any]) -> str:
+    """Hash the persisted content of a state, ignoring run metadata."""
+    content = [state["claims"], state["payouts"], state["notified_expired_claims"]]
+    if HAS_ORJSON:
+        payload = orjson.dumps(content, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(content, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
 
 class Claim:
     """Represents a class action claim."""
-    
+
+    __slots__ = ('claim_id', 'title', 'description', 'filing_deadline',
+                 'claim_amount', 'category', 'status', 'claim_url',
+                 'discovered_date')
+
     def __init__(self, claim_id: str, title: str, description: str,
                  filing_deadline: datetime, claim_amount: Optional[str],
-                 category: str, status: str, claim_url: str):
+                 category: str, status: str, claim_url: str,
+                 discovered_date: Optional[datetime] = None):
         self.claim_id = claim_id
         self.title = title
         self.description = description
@@ -65,7 +128,7 @@ class Claim:
         self.category = category
         self.status = status
         self.claim_url = claim_url
-        self.discovered_date = datetime.now()
+        self.discovered_date = discovered_date or datetime.now()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert claim to dictionary."""
@@ -84,41 +147,68 @@ class Claim:
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> 'Claim':
         """Create claim from dictionary."""
-        claim = Claim(
+        return Claim(
             claim_id=data["claim_id"],
             title=data["title"],
             description=data["description"],
-            filing_deadline=datetime.fromisoformat(data["filing_deadline"]) if data.get("filing_deadline") else None,
+            filing_deadline=_parse_iso(data["filing_deadline"]) if data.get("filing_deadline") else None,
             claim_amount=data.get("claim_amount"),
             category=data["category"],
             status=data["status"],
-            claim_url=data["claim_url"]
+            claim_url=data["claim_url"],
+            discovered_date=_parse_iso(data["discovered_date"]) if data.get("discovered_date") else None
         )
-        if data.get("discovered_date"):
-            claim.discovered_date = datetime.fromisoformat(data["discovered_date"])
-        return claim
     
-    def is_expiring_soon(self, days: int = 30) -> bool:
-        """Check if claim is expiring within specified days."""
+    def is_expiring_soon(self, days: int = 30, now: Optional[datetime] = None) -> bool:
+        """
+        Check if claim is expiring within specified days.
+        Pass `now` to evaluate many claims against one clock reading.
+        """
         if not self.filing_deadline:
             return False
-        days_until_deadline = (self.filing_deadline - datetime.now()).days
+        days_until_deadline = (self.filing_deadline - (now or datetime.now())).days
         return 0 < days_until_deadline <= days
     
-    def is_expired(self) -> bool:
-        """Check if claim has expired."""
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
+        """
+        Check if claim has expired.
+        Pass `now` to evaluate many claims against one clock reading.
+        """
         if not self.filing_deadline:
             return False
-        return datetime.now() > self.filing_deadline
+        return (now or datetime.now()) > self.filing_deadline
+
+    @staticmethod
+    def evaluate(claims: List['Claim'], days: int = 30,
+                 now: Optional[datetime] = None) -> Tuple[List['Claim'], List['Claim']]:
+        """
+        Split claims into (expired, expiring_soon) in a single pass against one
+        clock reading. Matches is_expired() and is_expiring_soon(days).
+        """
+        now = now or datetime.now()
+        expired = []
+        expiring_soon = []
+        for claim in claims:
+            if not claim.filing_deadline:
+                continue
+            if now > claim.filing_deadline:
+                expired.append(claim)
+            elif 0 < (claim.filing_deadline - now).days <= days:
+                expiring_soon.append(claim)
+        return expired, expiring_soon
 
 
 class Payout:
     """Represents a class action payout."""
-    
+
+    __slots__ = ('payout_id', 'claim_id', 'title', 'amount',
+                 'announcement_date', 'distribution_date', 'status',
+                 'payout_url', 'discovered_date')
+
     def __init__(self, payout_id: str, claim_id: str, title: str,
                  amount: str, announcement_date: datetime,
                  distribution_date: Optional[datetime], status: str,
-                 payout_url: str):
+                 payout_url: str, discovered_date: Optional[datetime] = None):
         self.payout_id = payout_id
         self.claim_id = claim_id
         self.title = title
@@ -127,7 +217,7 @@ class Payout:
         self.distribution_date = distribution_date
         self.status = status
         self.payout_url = payout_url
-        self.discovered_date = datetime.now()
+        self.discovered_date = discovered_date or datetime.now()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert payout to dictionary."""
@@ -146,25 +236,86 @@ class Payout:
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> 'Payout':
         """Create payout from dictionary."""
-        payout = Payout(
+        return Payout(
             payout_id=data["payout_id"],
             claim_id=data["claim_id"],
             title=data["title"],
             amount=data["amount"],
-            announcement_date=datetime.fromisoformat(data["announcement_date"]),
-            distribution_date=datetime.fromisoformat(data["distribution_date"]) if data.get("distribution_date") else None,
+            announcement_date=_parse_iso(data["announcement_date"]),
+            distribution_date=_parse_iso(data["distribution_date"]) if data.get("distribution_date") else None,
             status=data["status"],
-            payout_url=data["payout_url"]
+            payout_url=data["payout_url"],
+            discovered_date=_parse_iso(data["discovered_date"]) if data.get("discovered_date") else None
         )
-        if data.get("discovered_date"):
-            payout.discovered_date = datetime.fromisoformat(data["discovered_date"])
-        return payout
+
+
+class LazyClaimIndex(Mapping):
+    """
+    Read-only mapping of claim_id to Claim built from serialized claim dicts.
+    Each entry is deserialized on first access, so callers only pay for the
+    claims they actually look at.
+    """
+
+    def __init__(self, raw_claims: Dict[str, Dict[str, Any]]):
+        self._raw = raw_claims
+        self._cache: Dict[str, Claim] = {}
+
+    def __getitem__(self, claim_id: str) -> Claim:
+        claim = self._cache.get(claim_id)
+        if claim is None:
+            claim = self._cache[claim_id] = Claim.from_dict(self._raw[claim_id])
+        return claim
+
+    def __contains__(self, claim_id: object) -> bool:
+        return claim_id in self._raw
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
 
 
 # ============================================================================
 # MOCK DATA GENERATOR (Replace with real API/scraper in production)
 # ============================================================================
 
+# Static fields of the mock records; only the dates are relative to "now".
+# (claim_id, title, description, deadline_days, claim_amount, category, status, claim_url)
+_CLAIM_TEMPLATES = (
+    ("CAC-2024-001", "XYZ Data Breach Settlement",
+     "Settlement for customers affected by 2023 data breach",
+     45, "Up to $500", "data_breach", "active",
+     "https://example.com/xyz-settlement"),
+    ("CAC-2024-002", "ABC Electronics Product Defect Settlement",
+     "Settlement for defective smartphone batteries",
+     15, "Up to $350 or replacement", "consumer_products", "active",
+     "https://example.com/abc-settlement"),
+    ("CAC-2024-003", "DEF Telecom Overcharging Settlement",
+     "Settlement for customers who were overcharged",
+     90, "Estimated $50-150", "telecommunications", "active",
+     "https://example.com/def-settlement"),
+    ("CAC-2023-045", "GHI Auto Airbag Recall Settlement",
+     "Settlement for vehicles with defective airbags",
+     5, "Up to $1,000", "automotive", "active",
+     "https://example.com/ghi-settlement"),
+    ("CAC-2023-089", "JKL Insurance Denial Settlement",
+     "Settlement for improperly denied insurance claims",
+     120, "Varies by claim", "insurance", "active",
+     "https://example.com/jkl-settlement"),
+)
+
+# (payout_id, claim_id, title, amount, announced_days_ago, distribution_days, status, payout_url)
+_PAYOUT_TEMPLATES = (
+    ("PAY-2024-001", "CAC-2023-025", "MNO Bank Overdraft Fee Settlement Payout",
+     "$87.5 million total fund", 2, 30, "approved",
+     "https://example.com/mno-payout"),
+    ("PAY-2024-002", "CAC-2023-067", "PQR Retailer Price Fixing Settlement Payout",
+     "$125 million total fund", 1, 45, "approved",
+     "https://example.com/pqr-payout"),
+)
+
+
 def generate_mock_claims() -> List[Claim]:
     """
     Generate mock class action claims data.
@@ -176,59 +327,13 @@ def generate_mock_claims() -> List[Claim]:
     - JND Legal Administration
     - Settlement websites
     """
-    mock_claims = [
-        Claim(
-            claim_id="CAC-2024-001",
-            title="XYZ Data Breach Settlement",
-            description="Settlement for customers affected by 2023 data breach",
-            filing_deadline=datetime.now() + timedelta(days=45),
-            claim_amount="Up to $500",
-            category="data_breach",
-            status="active",
-            claim_url="https://example.com/xyz-settlement"
-        ),
-        Claim(
-            claim_id="CAC-2024-002",
-            title="ABC Electronics Product Defect Settlement",
-            description="Settlement for defective smartphone batteries",
-            filing_deadline=datetime.now() + timedelta(days=15),
-            claim_amount="Up to $350 or replacement",
-            category="consumer_products",
-            status="active",
-            claim_url="https://example.com/abc-settlement"
-        ),
-        Claim(
-            claim_id="CAC-2024-003",
-            title="DEF Telecom Overcharging Settlement",
-            description="Settlement for customers who were overcharged",
-            filing_deadline=datetime.now() + timedelta(days=90),
-            claim_amount="Estimated $50-150",
-            category="telecommunications",
-            status="active",
-            claim_url="https://example.com/def-settlement"
-        ),
-        Claim(
-            claim_id="CAC-2023-045",
-            title="GHI Auto Airbag Recall Settlement",
-            description="Settlement for vehicles with defective airbags",
-            filing_deadline=datetime.now() + timedelta(days=5),
-            claim_amount="Up to $1,000",
-            category="automotive",
-            status="active",
-            claim_url="https://example.com/ghi-settlement"
-        ),
-        Claim(
-            claim_id="CAC-2023-089",
-            title="JKL Insurance Denial Settlement",
-            description="Settlement for improperly denied insurance claims",
-            filing_deadline=datetime.now() + timedelta(days=120),
-            claim_amount="Varies by claim",
-            category="insurance",
-            status="active",
-            claim_url="https://example.com/jkl-settlement"
-        ),
+    now = datetime.now()
+    return [
+        Claim(claim_id, title, description, now + timedelta(days=deadline_days),
+              claim_amount, category, status, claim_url, discovered_date=now)
+        for (claim_id, title, description, deadline_days,
+             claim_amount, category, status, claim_url) in _CLAIM_TEMPLATES
     ]
-    return mock_claims
 
 
 def generate_mock_payouts() -> List[Payout]:
@@ -236,35 +341,40 @@ def generate_mock_payouts() -> List[Payout]:
     Generate mock payout data.
     In production, this would connect to real payout tracking systems.
     """
-    mock_payouts = [
-        Payout(
-            payout_id="PAY-2024-001",
-            claim_id="CAC-2023-025",
-            title="MNO Bank Overdraft Fee Settlement Payout",
-            amount="$87.5 million total fund",
-            announcement_date=datetime.now() - timedelta(days=2),
-            distribution_date=datetime.now() + timedelta(days=30),
-            status="approved",
-            payout_url="https://example.com/mno-payout"
-        ),
-        Payout(
-            payout_id="PAY-2024-002",
-            claim_id="CAC-2023-067",
-            title="PQR Retailer Price Fixing Settlement Payout",
-            amount="$125 million total fund",
-            announcement_date=datetime.now() - timedelta(days=1),
-            distribution_date=datetime.now() + timedelta(days=45),
-            status="approved",
-            payout_url="https://example.com/pqr-payout"
-        ),
+    now = datetime.now()
+    return [
+        Payout(payout_id, claim_id, title, amount,
+               now - timedelta(days=announced_days_ago),
+               now + timedelta(days=distribution_days),
+               status, payout_url, discovered_date=now)
+        for (payout_id, claim_id, title, amount, announced_days_ago,
+             distribution_days, status, payout_url) in _PAYOUT_TEMPLATES
     ]
-    return mock_payouts
 
 
 # ============================================================================
 # NOTIFIER INTERFACE AND IMPLEMENTATIONS
 # ============================================================================
 
+# Separator lines used in email bodies
+EMAIL_RULE = "=" * 70 + "\n"
+EMAIL_SECTION_RULE = "-" * 70 + "\n"
+
+
+def _group_notifications(notifications: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Split notifications by type in a single pass; unknown types are dropped."""
+    buckets: Dict[str, List[Dict[str, Any]]] = {
+        'expiring_claim': [],
+        'expired_claim': [],
+        'new_payout': [],
+    }
+    for notif in notifications:
+        bucket = buckets.get(notif['type'])
+        if bucket is not None:
+            bucket.append(notif)
+    return buckets
+
+
 class Notifier(ABC):
     """Abstract base class for notification systems."""
     
@@ -273,6 +383,10 @@ class Notifier(ABC):
         """Send notifications. Returns True if successful."""
         pass
 
+    def close(self) -> None:
+        """Release any resources held by the notifier."""
+        pass
+
 
 class EmailNotifier(Notifier):
     """Email notifier using SMTP."""
@@ -296,9 +410,10 @@ class EmailNotifier(Notifier):
         self.smtp_from = smtp_from or os.environ.get('SMTP_FROM', '')
         self.smtp_to = smtp_to or os.environ.get('SMTP_TO', '')
         self.use_starttls = use_starttls
+        self._server: Optional['smtplib.SMTP'] = None
         
         # Validate configuration
-        if not all([self.smtp_host, self.smtp_from, self.smtp_to]):
+        if not (self.smtp_host and self.smtp_from and self.smtp_to):
             raise ValueError("SMTP_HOST, SMTP_FROM, and SMTP_TO must be configured")
     
     def send(self, notifications: List[Dict[str, Any]], summary: Dict[str, Any]) -> bool:
@@ -307,6 +422,10 @@ class EmailNotifier(Notifier):
             # No changes, no email
             return True
         
+        # Imported here so console-only runs never pay for smtplib/email startup
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
+
         try:
             # Create message
             msg = MIMEMultipart('alternative')
@@ -319,67 +438,102 @@ class EmailNotifier(Notifier):
             msg.attach(MIMEText(body, 'plain'))
             
             # Send email
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                if self.use_starttls:
-                    server.starttls()
-                if self.smtp_username and self.smtp_password:
-                    server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
+            self._get_connection().send_message(msg)
             
             return True
         except Exception as e:
             print(f"Error sending email notification: {e}")
+            # Drop the connection so the next send starts from a fresh one
+            self.close()
             return False
+
+    def _get_connection(self) -> 'smtplib.SMTP':
+        """Return a logged-in SMTP connection, reusing the open one while it is alive."""
+        import smtplib
+
+        if self._server is not None:
+            try:
+                self._server.noop()
+                return self._server
+            except (smtplib.SMTPException, OSError):
+                self.close()
+
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+        try:
+            if self.use_starttls:
+                server.starttls()
+            if self.smtp_username and self.smtp_password:
+                server.login(self.smtp_username, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+
+        self._server = server
+        return server
+
+    def close(self) -> None:
+        """Close the cached SMTP connection, if any."""
+        if self._server is None:
+            return
+        import smtplib
+
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            self._server.close()
+        finally:
+            self._server = None
     
     def _format_email_body(self, notifications: List[Dict[str, Any]], summary: Dict[str, Any]) -> str:
         """Format email body with notification details."""
-        lines = []
-        lines.append("CLASS ACTION CLAIMS DAILY ALERT")
-        lines.append("=" * 70)
-        lines.append(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"Total Updates: {len(notifications)}")
-        lines.append("")
+        buf = io.StringIO()
+        w = buf.write
+        w("CLASS ACTION CLAIMS DAILY ALERT\n")
+        w(EMAIL_RULE)
+        w(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        w(f"Total Updates: {len(notifications)}\n\n")
         
         # Group notifications by type
-        expiring = [n for n in notifications if n['type'] == 'expiring_claim']
-        expired = [n for n in notifications if n['type'] == 'expired_claim']
-        new_payouts = [n for n in notifications if n['type'] == 'new_payout']
+        buckets = _group_notifications(notifications)
+        expiring = buckets['expiring_claim']
+        expired = buckets['expired_claim']
+        new_payouts = buckets['new_payout']
         
         if expiring:
-            lines.append(f"⚠️  EXPIRING CLAIMS ({len(expiring)}):")
-            lines.append("-" * 70)
+            w(f"⚠️  EXPIRING CLAIMS ({len(expiring)}):\n")
+            w(EMAIL_SECTION_RULE)
             for notif in expiring:
-                lines.append(f"\n• {notif['title']}")
-                lines.append(f"  {notif['message']}")
-                lines.append(f"  Deadline: {notif['filing_deadline']}")
-                lines.append(f"  Amount: {notif['amount']}")
-                lines.append(f"  URL: {notif['url']}")
-            lines.append("")
+                w(f"\n• {notif['title']}\n")
+                w(f"  {notif['message']}\n")
+                w(f"  Deadline: {notif['filing_deadline']}\n")
+                w(f"  Amount: {notif['amount']}\n")
+                w(f"  URL: {notif['url']}\n")
+            w("\n")
         
         if expired:
-            lines.append(f"❌ EXPIRED CLAIMS ({len(expired)}):")
-            lines.append("-" * 70)
+            w(f"❌ EXPIRED CLAIMS ({len(expired)}):\n")
+            w(EMAIL_SECTION_RULE)
             for notif in expired:
-                lines.append(f"\n• {notif['title']}")
-                lines.append(f"  Expired: {notif['filing_deadline']}")
-                lines.append(f"  URL: {notif['url']}")
-            lines.append("")
+                w(f"\n• {notif['title']}\n")
+                w(f"  Expired: {notif['filing_deadline']}\n")
+                w(f"  URL: {notif['url']}\n")
+            w("\n")
         
         if new_payouts:
-            lines.append(f"💰 NEW PAYOUTS ({len(new_payouts)}):")
-            lines.append("-" * 70)
+            w(f"💰 NEW PAYOUTS ({len(new_payouts)}):\n")
+            w(EMAIL_SECTION_RULE)
             for notif in new_payouts:
-                lines.append(f"\n• {notif['title']}")
-                lines.append(f"  Amount: {notif['amount']}")
-                lines.append(f"  Announced: {notif['announcement_date']}")
-                lines.append(f"  Distribution: {notif['distribution_date']}")
-                lines.append(f"  URL: {notif['url']}")
-            lines.append("")
+                w(f"\n• {notif['title']}\n")
+                w(f"  Amount: {notif['amount']}\n")
+                w(f"  Announced: {notif['announcement_date']}\n")
+                w(f"  Distribution: {notif['distribution_date']}\n")
+                w(f"  URL: {notif['url']}\n")
+            w("\n")
         
-        lines.append("=" * 70)
-        lines.append("This is an automated alert. Updates are sent only when changes occur.")
+        w(EMAIL_RULE)
+        w("This is an automated alert. Updates are sent only when changes occur.")
         
-        return "\n".join(lines)
+        return buf.getvalue()
 
 
 class ConsoleNotifier(Notifier):
@@ -391,16 +545,16 @@ class ConsoleNotifier(Notifier):
             print("✅ NO NEW NOTIFICATIONS - All claims unchanged since last run")
             return True
         
-        print(f"\n🔔 {len(notifications)} NOTIFICATION(S):")
-        print("=" * 70)
-        
+        # Build the whole block and write it with a single print
+        lines = [f"\n🔔 {len(notifications)} NOTIFICATION(S):", "=" * 70]
         for notif in notifications:
-            print(f"\n[{notif['type'].upper()}] {notif['title']}")
-            print(f"  {notif['message']}")
+            lines.append(f"\n[{notif['type'].upper()}] {notif['title']}")
+            lines.append(f"  {notif['message']}")
             if 'url' in notif:
-                print(f"  {notif['url']}")
-        
-        print("\n" + "=" * 70)
+                lines.append(f"  {notif['url']}")
+        lines.append("\n" + "=" * 70)
+
+        print("\n".join(lines))
         return True
 
 
@@ -408,6 +562,32 @@ class ConsoleNotifier(Notifier):
 # CLASS ACTION CLAIMS AGENT
 # ============================================================================
 
+# Separator lines used in the daily report and console output
+REPORT_RULE = "=" * 80
+REPORT_SECTION_RULE = "-" * 80
+REPORT_HEADER = f"{REPORT_RULE}\nCLASS ACTION CLAIMS AGENT - DAILY REPORT\n{REPORT_RULE}\n"
+
+# Per-notification entries of the daily report, filled from notification dicts
+REPORT_EXPIRING_ITEM = (
+    "\n  • {title}\n"
+    "    {message}\n"
+    "    Deadline: {filing_deadline}\n"
+    "    Amount: {amount}\n"
+    "    URL: {url}"
+)
+REPORT_EXPIRED_ITEM = (
+    "\n  • {title}\n"
+    "    {message}\n"
+    "    Expired: {filing_deadline}"
+)
+REPORT_PAYOUT_ITEM = (
+    "\n  • {title}\n"
+    "    {message}\n"
+    "    Announced: {announcement_date}\n"
+    "    Distribution: {distribution_date}\n"
+    "    URL: {url}"
+)
+
 class ClassActionClaimsAgent:
     """
     Agent to monitor class action claims and payouts.
@@ -418,7 +598,8 @@ class ClassActionClaimsAgent:
                  state_file: Optional[str] = None,
                  expiring_window_days: int = DEFAULT_EXPIRING_WINDOW_DAYS,
                  recent_payout_window_days: int = DEFAULT_RECENT_PAYOUT_WINDOW_DAYS,
-                 notifier: Optional[Notifier] = None):
+                 notifier: Optional[Notifier] = None,
+                 pretty_state: bool = False):
         # Allow state file override via parameter or environment variable
         if state_file is None:
             state_file = os.environ.get('CLASS_ACTION_STATE_FILE', DEFAULT_STATE_FILE)
@@ -427,53 +608,168 @@ class ClassActionClaimsAgent:
         self.expiring_window_days = expiring_window_days
         self.recent_payout_window_days = recent_payout_window_days
         self.notifier = notifier or ConsoleNotifier()
+        self.pretty_state = pretty_state
         
         self.current_claims: List[Claim] = []
         self.current_payouts: List[Payout] = []
         self.previous_state: Optional[Dict[str, Any]] = None
         self.notifications: List[Dict[str, Any]] = []
+
+        # Lookups derived from previous_state, rebuilt on each load
+        self._prev_claims_by_id: LazyClaimIndex = LazyClaimIndex({})
+        self._prev_payout_ids: frozenset = frozenset()
+        self._notified_expired: frozenset = frozenset()
+
+        # Last state this instance read or wrote, keyed by the file's
+        # (inode, mtime_ns, size), so repeated runs skip re-parsing an unchanged
+        # file; the inode catches a same-size replacement within mtime resolution
+        self._state_cache: Optional[Tuple[Tuple[int, int, int], Dict[str, Any]]] = None
+
+        # Clock reading shared by every check within one run()
+        self._now: Optional[datetime] = None
     
+    def _current_time(self) -> datetime:
+        """Return the clock reading of the current run, or now outside of run()."""
+        return self._now or datetime.now()
+
     def load_previous_state(self) -> None:
         """Load previous run state from file."""
-        if os.path.exists(self.state_file):
-            try:
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    self.previous_state = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load previous state: {e}")
-                self.previous_state = None
-        else:
+        try:
+            st = os.stat(self.state_file)
+        except OSError:
             self.previous_state = None
+            self._state_cache = None
+        else:
+            stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+            if self._state_cache is not None and self._state_cache[0] == stamp:
+                self.previous_state = self._state_cache[1]
+            else:
+                try:
+                    with open(self.state_file, 'rb') as f:
+                        self.previous_state = _loads_state(f.read())
+                    self._state_cache = (stamp, self.previous_state)
+                except (json.JSONDecodeError, IOError) as e:
+                    print(f"Warning: Could not load previous state: {e}")
+                    self.previous_state = None
+                    self._state_cache = None
+
+        self._index_previous_state()
+
+    def _index_previous_state(self) -> None:
+        """Build the lookups the detectors need from the loaded previous state."""
+        previous_state = self.previous_state or {}
+        self._prev_claims_by_id = LazyClaimIndex({
+            c["claim_id"]: c for c in previous_state.get("claims", [])
+        })
+        self._prev_payout_ids = frozenset(
+            p["payout_id"] for p in previous_state.get("payouts", [])
+        )
+        self._notified_expired = frozenset(previous_state.get("notified_expired_claims", []))
     
     def save_current_state(self) -> None:
-        """Save current state to file."""
+        """
+        Save current state to file.
+
+        Claims and payouts already known from the previous state keep their
+        original discovered_date, so a run that finds nothing new produces the
+        same content hash as last time; the state file is then left untouched,
+        so its last_run records the last run that changed it. Every run also
+        writes its time to the small <state_file>.last_run sidecar.
+        """
         state = {
-            "last_run": datetime.now().isoformat(),
+            "last_run": self._current_time().isoformat(),
             "claims": [claim.to_dict() for claim in self.current_claims],
             "payouts": [payout.to_dict() for payout in self.current_payouts],
-            "notified_expired_claims": self.previous_state.get("notified_expired_claims", []) if self.previous_state else []
+            "notified_expired_claims": list(self.previous_state.get("notified_expired_claims", [])) if self.previous_state else []
         }
-        
-        # Add newly expired claims to the notified list
+
+        # Add newly expired claims to the notified list, checking duplicates
+        # against a set while the list keeps its order
+        notified = state['notified_expired_claims']
+        seen = set(notified)
         for notif in self.notifications:
-            if notif['type'] == 'expired_claim' and notif['claim_id'] not in state['notified_expired_claims']:
-                state['notified_expired_claims'].append(notif['claim_id'])
-        
+            if notif['type'] == 'expired_claim' and notif['claim_id'] not in seen:
+                seen.add(notif['claim_id'])
+                notified.append(notif['claim_id'])
+
+        # Only claims carried into this state can be detected as expired next
+        # run, so drop ids of the others instead of letting the list grow forever
+        saved_ids = {claim['claim_id'] for claim in state['claims']}
+        state['notified_expired_claims'] = [
+            claim_id for claim_id in state['notified_expired_claims'] if claim_id in saved_ids
+        ]
+
+        if self.previous_state:
+            self._carry_forward_discovered_dates(state["claims"], self.previous_state.get("claims", []), "claim_id")
+            self._carry_forward_discovered_dates(state["payouts"], self.previous_state.get("payouts", []), "payout_id")
+
+        state["content_hash"] = _state_content_hash(state)
+
+        # Nothing changed since last run, keep the file as it is
+        if self.previous_state and self.previous_state.get("content_hash") == state["content_hash"]:
+            self._record_last_run(state["last_run"])
+            return
+
+        # Write to a sibling temp file and rename it over the state file, so a
+        # crash mid-write never leaves a truncated state behind
+        tmp_file = self.state_file + ".tmp"
         try:
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(state, f, indent=2)
+            with open(tmp_file, 'wb', buffering=1 << 20) as f:
+                f.write(_dumps_state(state, self.pretty_state))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.state_file)
+            st = os.stat(self.state_file)
+            self._state_cache = ((st.st_ino, st.st_mtime_ns, st.st_size), state)
         except IOError as e:
             print(f"Error: Could not save state: {e}")
-    
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            return
+
+        self._record_last_run(state["last_run"])
+
+    def _record_last_run(self, run_time: str) -> None:
+        """Write the run time to the .last_run sidecar, replacing it atomically."""
+        last_run_file = self.state_file + ".last_run"
+        tmp_file = last_run_file + ".tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(run_time + "\n")
+            os.replace(tmp_file, last_run_file)
+        except IOError as e:
+            print(f"Warning: Could not record last run: {e}")
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+
+    @staticmethod
+    def _carry_forward_discovered_dates(records: List[Dict[str, Any]],
+                                        previous_records: List[Dict[str, Any]],
+                                        id_key: str) -> None:
+        """Keep the discovered_date of records already present in the previous state."""
+        previous_dates = {
+            record[id_key]: record["discovered_date"]
+            for record in previous_records
+            if record.get("discovered_date")
+        }
+        for record in records:
+            if record[id_key] in previous_dates:
+                record["discovered_date"] = previous_dates[record[id_key]]
+
     def fetch_active_claims(self) -> List[Claim]:
         """
         Fetch all active class action claims.
         In production, this would use real APIs or web scraping.
         """
         claims = generate_mock_claims()
-        
-        # Filter for active claims only (not expired)
-        active_claims = [claim for claim in claims if not claim.is_expired()]
+
+        # Filter for active claims only (not expired), against one clock reading;
+        # same test as Claim.is_expired, inlined to skip a call per claim
+        now = self._current_time()
+        active_claims = [
+            claim for claim in claims
+            if not claim.filing_deadline or claim.filing_deadline >= now
+        ]
         
         self.current_claims = active_claims
         return active_claims
@@ -489,7 +785,7 @@ class ClassActionClaimsAgent:
         payouts = generate_mock_payouts()
         
         # Filter for recent payouts
-        cutoff_date = datetime.now() - timedelta(days=days)
+        cutoff_date = self._current_time() - timedelta(days=days)
         recent_payouts = [
             payout for payout in payouts 
             if payout.announcement_date >= cutoff_date
@@ -498,36 +794,37 @@ class ClassActionClaimsAgent:
         self.current_payouts = recent_payouts
         return recent_payouts
     
-    def detect_expiring_claims(self, days: Optional[int] = None) -> List[Claim]:
-        """Detect claims expiring within specified days."""
+    def detect_expiring_claims(self, days: Optional[int] = None,
+                               expiring_soon: Optional[List[Claim]] = None) -> List[Claim]:
+        """
+        Detect claims expiring within specified days.
+
+        Args:
+            days: Expiring window, defaults to expiring_window_days
+            expiring_soon: Current claims already known to fall in the window,
+                as computed once by run(); evaluated here if not given
+        """
         if days is None:
             days = self.expiring_window_days
-            
+
+        now = self._current_time()
+
+        if expiring_soon is None:
+            _, expiring_soon = Claim.evaluate(self.current_claims, days, now)
+
+        # First run, include all expiring claims
+        if not self.previous_state:
+            return list(expiring_soon)
+
         expiring = []
-        
-        for claim in self.current_claims:
-            if claim.is_expiring_soon(days):
-                # Check if this is a newly detected expiring claim
-                if self.previous_state:
-                    prev_claims = [
-                        Claim.from_dict(c) 
-                        for c in self.previous_state.get("claims", [])
-                    ]
-                    prev_claim = next(
-                        (c for c in prev_claims if c.claim_id == claim.claim_id),
-                        None
-                    )
-                    
-                    # Only notify if claim wasn't previously marked as expiring
-                    # or if this is the first run
-                    if prev_claim is None or not prev_claim.is_expiring_soon(days):
-                        expiring.append(claim)
-                else:
-                    # First run, include all expiring claims
-                    expiring.append(claim)
-        
+        for claim in expiring_soon:
+            # Only notify if claim wasn't previously marked as expiring
+            prev_claim = self._prev_claims_by_id.get(claim.claim_id)
+            if prev_claim is None or not prev_claim.is_expiring_soon(days, now):
+                expiring.append(claim)
+
         return expiring
-    
+
     def detect_expired_claims(self) -> List[Claim]:
         """
         Detect claims that have expired since last run.
@@ -537,74 +834,49 @@ class ClassActionClaimsAgent:
         """
         if not self.previous_state:
             return []
-        
-        expired = []
-        notified_expired = set(self.previous_state.get("notified_expired_claims", []))
-        
-        # Get previous claims
-        prev_claims = [
-            Claim.from_dict(c) 
-            for c in self.previous_state.get("claims", [])
+
+        now = self._current_time()
+        notified_expired = self._notified_expired
+        prev_claims_by_id = self._prev_claims_by_id
+        current_ids = {claim.claim_id for claim in self.current_claims}
+
+        # Case 1: Claim is missing from current fetch and is expired
+        expired = [
+            prev_claims_by_id[claim_id] for claim_id in prev_claims_by_id
+            if claim_id not in notified_expired
+            and claim_id not in current_ids
+            and prev_claims_by_id[claim_id].is_expired(now)
         ]
-        
-        # Create lookup dictionaries
-        current_claims_by_id = {claim.claim_id: claim for claim in self.current_claims}
-        prev_claims_by_id = {claim.claim_id: claim for claim in prev_claims}
-        
-        # Check all claims from previous state
-        for prev_claim in prev_claims:
-            # Skip if we already notified about this expiration
-            if prev_claim.claim_id in notified_expired:
-                continue
-            
-            # Case 1: Claim was not expired in previous run but is now expired
-            if not prev_claim.is_expired() and datetime.now() > prev_claim.filing_deadline:
-                expired.append(prev_claim)
-            # Case 2: Claim is missing from current fetch and was expired
-            elif prev_claim.claim_id not in current_claims_by_id and prev_claim.is_expired():
-                expired.append(prev_claim)
-        
-        # Also check current claims that may have expired since last run
+
+        # Case 2: Claim exists in both, was not expired before and is now expired
         for claim in self.current_claims:
-            # Skip if already notified
-            if claim.claim_id in notified_expired:
+            if claim.claim_id in notified_expired or claim.claim_id not in prev_claims_by_id:
                 continue
-                
-            # If claim exists in both but was not expired before and is now expired
-            if claim.claim_id in prev_claims_by_id:
-                prev_claim = prev_claims_by_id[claim.claim_id]
-                if not prev_claim.is_expired() and claim.is_expired():
-                    # Claim crossed deadline between runs
-                    expired.append(claim)
-        
+            if not prev_claims_by_id[claim.claim_id].is_expired(now) and claim.is_expired(now):
+                expired.append(claim)
+
         return expired
-    
+
     def detect_new_payouts(self) -> List[Payout]:
         """Detect new payouts since last run."""
         if not self.previous_state:
             # First run, all current payouts are "new"
             return self.current_payouts
         
-        new_payouts = []
-        prev_payout_ids = {
-            p["payout_id"] 
-            for p in self.previous_state.get("payouts", [])
-        }
-        
-        for payout in self.current_payouts:
-            if payout.payout_id not in prev_payout_ids:
-                new_payouts.append(payout)
-        
-        return new_payouts
+        return [
+            payout for payout in self.current_payouts
+            if payout.payout_id not in self._prev_payout_ids
+        ]
     
-    def generate_notifications(self) -> List[Dict[str, Any]]:
+    def generate_notifications(self, expiring_soon: Optional[List[Claim]] = None) -> List[Dict[str, Any]]:
         """Generate notifications for changes."""
         notifications = []
+        now = self._current_time()
         
         # Notify about expiring claims
-        expiring = self.detect_expiring_claims()
+        expiring = self.detect_expiring_claims(expiring_soon=expiring_soon)
         for claim in expiring:
-            days_left = (claim.filing_deadline - datetime.now()).days
+            days_left = (claim.filing_deadline - now).days
             notifications.append({
                 "type": "expiring_claim",
                 "severity": "high" if days_left <= 7 else "medium",
@@ -655,103 +927,105 @@ class ClassActionClaimsAgent:
         Args:
             skip_report: If True, don't write JSON report file
         """
-        # Load previous state
-        self.load_previous_state()
-        
-        # Fetch current data
-        active_claims = self.fetch_active_claims()
-        recent_payouts = self.fetch_recent_payouts()
+        # One clock reading for every deadline check in this run
+        self._now = datetime.now()
+        try:
+            # Load previous state
+            self.load_previous_state()
         
-        # Generate notifications for changes
-        notifications = self.generate_notifications()
+            # Fetch current data
+            active_claims = self.fetch_active_claims()
+            recent_payouts = self.fetch_recent_payouts()
+
+            # Split out the claims in the expiring window once; detection and
+            # the summary both use it
+            _, expiring_soon = Claim.evaluate(active_claims, self.expiring_window_days, self._now)
         
-        # Send notifications (only if there are changes)
-        if notifications:
-            self.notifier.send(notifications, {"notifications": notifications})
+            # Generate notifications for changes
+            notifications = self.generate_notifications(expiring_soon)
         
-        # Save current state for next run
-        self.save_current_state()
+            # Send notifications (only if there are changes)
+            if notifications:
+                self.notifier.send(notifications, {"notifications": notifications})
         
-        # Generate summary
-        summary = {
-            "run_date": datetime.now().isoformat(),
-            "total_active_claims": len(active_claims),
-            "total_recent_payouts": len(recent_payouts),
-            "notifications_count": len(notifications),
-            "notifications": notifications,
-            "claims_by_category": self.get_claims_by_category(),
-            "expiring_soon": len([c for c in active_claims if c.is_expiring_soon(self.expiring_window_days)])
-        }
+            # Save current state for next run
+            self.save_current_state()
+
+            # Generate summary
+            summary = {
+                "run_date": self._now.isoformat(),
+                "total_active_claims": len(active_claims),
+                "total_recent_payouts": len(recent_payouts),
+                "notifications_count": len(notifications),
+                "notifications": notifications,
+                "claims_by_category": self.get_claims_by_category(),
+                "expiring_soon": len(expiring_soon)
+            }
         
-        return summary
+            return summary
+        finally:
+            self._now = None
+            # Don't leave a logged-in SMTP session open between scheduled runs
+            self.notifier.close()
     
     def get_claims_by_category(self) -> Dict[str, int]:
         """Get count of claims by category."""
-        category_counts = {}
-        for claim in self.current_claims:
-            category_counts[claim.category] = category_counts.get(claim.category, 0) + 1
-        return category_counts
+        return dict(Counter(claim.category for claim in self.current_claims))
     
     def format_notification_report(self, summary: Dict[str, Any]) -> str:
         """Format notifications as a readable report."""
-        report_lines = []
-        report_lines.append("=" * 80)
-        report_lines.append("CLASS ACTION CLAIMS AGENT - DAILY REPORT")
-        report_lines.append("=" * 80)
-        report_lines.append(f"Run Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append("")
+        buf = io.StringIO()
+        w = buf.write
+        run_ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        w(REPORT_HEADER)
+        w(f"Run Date: {run_ts}\n")
+        w("\n")
         
         # Summary
-        report_lines.append("📊 SUMMARY")
-        report_lines.append("-" * 80)
-        report_lines.append(f"Total Active Claims: {summary['total_active_claims']}")
-        report_lines.append(f"Claims Expiring Soon (30 days): {summary['expiring_soon']}")
-        report_lines.append(f"Recent Payouts (30 days): {summary['total_recent_payouts']}")
-        report_lines.append(f"Notifications: {summary['notifications_count']}")
-        report_lines.append("")
+        w("📊 SUMMARY\n")
+        w(REPORT_SECTION_RULE + "\n")
+        w(f"Total Active Claims: {summary['total_active_claims']}\n")
+        w(f"Claims Expiring Soon (30 days): {summary['expiring_soon']}\n")
+        w(f"Recent Payouts (30 days): {summary['total_recent_payouts']}\n")
+        w(f"Notifications: {summary['notifications_count']}\n")
+        w("\n")
         
         # Notifications
         if summary['notifications']:
-            report_lines.append("🔔 NOTIFICATIONS")
-            report_lines.append("-" * 80)
+            w("🔔 NOTIFICATIONS\n")
+            w(REPORT_SECTION_RULE + "\n")
             
             # Group by type
-            expiring = [n for n in summary['notifications'] if n['type'] == 'expiring_claim']
-            expired = [n for n in summary['notifications'] if n['type'] == 'expired_claim']
-            new_payouts = [n for n in summary['notifications'] if n['type'] == 'new_payout']
+            buckets = _group_notifications(summary['notifications'])
+            expiring = buckets['expiring_claim']
+            expired = buckets['expired_claim']
+            new_payouts = buckets['new_payout']
             
             if expiring:
-                report_lines.append("\n⚠️  EXPIRING CLAIMS:")
+                w("\n⚠️  EXPIRING CLAIMS:\n")
                 for notif in expiring:
-                    report_lines.append(f"\n  • {notif['title']}")
-                    report_lines.append(f"    {notif['message']}")
-                    report_lines.append(f"    Deadline: {notif['filing_deadline']}")
-                    report_lines.append(f"    Amount: {notif['amount']}")
-                    report_lines.append(f"    URL: {notif['url']}")
+                    w(REPORT_EXPIRING_ITEM.format_map(notif))
+                    w("\n")
             
             if expired:
-                report_lines.append("\n\n❌ EXPIRED CLAIMS:")
+                w("\n\n❌ EXPIRED CLAIMS:\n")
                 for notif in expired:
-                    report_lines.append(f"\n  • {notif['title']}")
-                    report_lines.append(f"    {notif['message']}")
-                    report_lines.append(f"    Expired: {notif['filing_deadline']}")
+                    w(REPORT_EXPIRED_ITEM.format_map(notif))
+                    w("\n")
             
             if new_payouts:
-                report_lines.append("\n\n💰 NEW PAYOUTS:")
+                w("\n\n💰 NEW PAYOUTS:\n")
                 for notif in new_payouts:
-                    report_lines.append(f"\n  • {notif['title']}")
-                    report_lines.append(f"    {notif['message']}")
-                    report_lines.append(f"    Announced: {notif['announcement_date']}")
-                    report_lines.append(f"    Distribution: {notif['distribution_date']}")
-                    report_lines.append(f"    URL: {notif['url']}")
+                    w(REPORT_PAYOUT_ITEM.format_map(notif))
+                    w("\n")
         else:
-            report_lines.append("✅ NO NEW NOTIFICATIONS")
-            report_lines.append("All claims and payouts are unchanged since last run.")
+            w("✅ NO NEW NOTIFICATIONS\n")
+            w("All claims and payouts are unchanged since last run.\n")
         
-        report_lines.append("")
-        report_lines.append("=" * 80)
+        w("\n")
+        w(REPORT_RULE)
         
-        return "\n".join(report_lines)
+        return buf.getvalue()
     
     def export_report(self, summary: Dict[str, Any], filename: Optional[str] = None) -> str:
         """Export report to JSON file."""
@@ -759,8 +1033,8 @@ class ClassActionClaimsAgent:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"class_action_report_{timestamp}.json"
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2)
+        with open(filename, 'wb', buffering=1 << 20) as f:
+            f.write(_dumps_state(summary))
         
         return filename
 
@@ -769,8 +1043,9 @@ class ClassActionClaimsAgent:
 # CLI PARSER
 # ============================================================================
 
-def parse_args():
-    """Parse command line arguments."""
+@lru_cache(maxsize=None)
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once per process."""
     parser = argparse.ArgumentParser(
         description='Class Action Claims Agent - Monitor claims and payouts',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -842,7 +1117,18 @@ Environment Variables:
         help='Send email notifications (requires SMTP env vars)'
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        '--pretty-state',
+        action='store_true',
+        help='Write the state file indented for human reading (default: compact)'
+    )
+    
+    return parser
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse command line arguments."""
+    return build_parser().parse_args(argv)
 
 
 # ============================================================================
@@ -853,10 +1139,10 @@ def main():
     """Main function to run the class action claims agent."""
     args = parse_args()
     
-    print("=" * 80)
+    print(REPORT_RULE)
     print("CLASS ACTION CLAIMS AGENT")
     print("Monitoring Active Claims and Payouts")
-    print("=" * 80)
+    print(REPORT_RULE)
     print()
     
     # Setup notifier
@@ -877,7 +1163,8 @@ def main():
         state_file=args.state_file,
         expiring_window_days=args.expiring_days,
         recent_payout_window_days=args.payout_days,
-        notifier=notifier
+        notifier=notifier,
+        pretty_state=args.pretty_state
     )
     
     print(f"📁 State file: {agent.state_file}")
@@ -889,10 +1176,12 @@ def main():
     print("🔍 Scanning for active claims and payouts...")
     summary = agent.run(skip_report=args.skip_report)
     
-    # Display report
+    # Display report; an idle run only needs a one-line status
     print()
-    report = agent.format_notification_report(summary)
-    print(report)
+    if summary['notifications']:
+        print(agent.format_notification_report(summary))
+    else:
+        print(f"✅ NO NEW NOTIFICATIONS - {summary['total_active_claims']} active claim(s) unchanged since last run")
     
     # Export report
     if not args.skip_report and summary['notifications']:
@@ -902,13 +1191,13 @@ def main():
     # Display claims by category
     if summary['claims_by_category']:
         print("\n📂 CLAIMS BY CATEGORY")
-        print("-" * 80)
+        print(REPORT_SECTION_RULE)
         for category, count in sorted(summary['claims_by_category'].items()):
             print(f"  {category}: {count}")
     
-    print("\n" + "=" * 80)
+    print("\n" + REPORT_RULE)
     print("✅ AGENT RUN COMPLETE")
-    print("=" * 80)
+    print(REPORT_RULE)
 
 
 if __name__ == "__main__":
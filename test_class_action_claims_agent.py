@@ -12,10 +12,11 @@ Tests cover:
 
 import json
 import os
+import shutil
 import tempfile
 import unittest
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 
 from class_action_claims_agent import (
     Claim,
@@ -77,6 +78,26 @@ class TestClaim(unittest.TestCase):
         )
         self.assertTrue(claim.is_expired())
     
+    def test_claim_evaluate(self):
+        """Test batched expired/expiring classification."""
+        now = datetime.now()
+        claims = [
+            Claim(
+                claim_id=f"TEST-00{i}",
+                title="Test",
+                description="Test",
+                filing_deadline=now + timedelta(days=offset) if offset is not None else None,
+                claim_amount="$100",
+                category="test",
+                status="active",
+                claim_url="https://example.com"
+            )
+            for i, offset in enumerate([-1, 15, 45, None])
+        ]
+        expired, expiring = Claim.evaluate(claims, days=30, now=now)
+        self.assertEqual([c.claim_id for c in expired], ["TEST-000"])
+        self.assertEqual([c.claim_id for c in expiring], ["TEST-001"])
+    
     def test_claim_to_dict_from_dict(self):
         """Test serialization and deserialization."""
         claim = Claim(
@@ -146,9 +167,7 @@ class TestClassActionClaimsAgent(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test files."""
-        if os.path.exists(self.state_file):
-            os.remove(self.state_file)
-        os.rmdir(self.temp_dir)
+        shutil.rmtree(self.temp_dir)
     
     def test_agent_initialization(self):
         """Test agent initialization."""
@@ -184,7 +203,85 @@ class TestClassActionClaimsAgent(unittest.TestCase):
         self.assertIsNotNone(new_agent.previous_state)
         self.assertEqual(len(new_agent.previous_state['claims']), 1)
         self.assertEqual(new_agent.previous_state['claims'][0]['claim_id'], "TEST-001")
-    
+
+    def test_state_not_rewritten_when_unchanged(self):
+        """Test that an idle run leaves the state file untouched."""
+        claim = Claim(
+            claim_id="TEST-001",
+            title="Test Claim",
+            description="Test",
+            filing_deadline=datetime.now() + timedelta(days=30),
+            claim_amount="$100",
+            category="test",
+            status="active",
+            claim_url="https://example.com"
+        )
+        self.agent.current_claims = [claim]
+        self.agent.save_current_state()
+
+        # Mark both files so a rewrite would be detectable
+        with open(self.state_file + ".last_run", 'w', encoding='utf-8') as f:
+            f.write("marker\n")
+        with open(self.state_file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        state['last_run'] = "marker"
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+
+        # Second run - same claim, rediscovered
+        new_agent = ClassActionClaimsAgent(state_file=self.state_file)
+        new_agent.load_previous_state()
+        new_agent.current_claims = [Claim.from_dict(claim.to_dict())]
+        new_agent.current_claims[0].discovered_date = datetime.now()
+        new_agent.save_current_state()
+
+        with open(self.state_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['last_run'], "marker")
+
+        # The run time itself still lands in the sidecar
+        with open(self.state_file + ".last_run", 'r', encoding='utf-8') as f:
+            self.assertNotEqual(f.read().strip(), "marker")
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ["test_state.json", "test_state.json.last_run"])
+
+    def test_saved_state_reused_without_reparsing(self):
+        """Test that a reload after saving reuses the in-memory state."""
+        self.agent.current_claims = [
+            Claim(
+                claim_id="TEST-001",
+                title="Test Claim",
+                description="Test",
+                filing_deadline=datetime.now() + timedelta(days=30),
+                claim_amount="$100",
+                category="test",
+                status="active",
+                claim_url="https://example.com"
+            )
+        ]
+        self.agent.save_current_state()
+
+        with patch('class_action_claims_agent._loads_state') as mock_loads:
+            self.agent.load_previous_state()
+            mock_loads.assert_not_called()
+        self.assertEqual(self.agent.previous_state['claims'][0]['claim_id'], "TEST-001")
+
+        # A same-size replacement carrying the old mtime is still picked up
+        with open(self.state_file, 'rb') as f:
+            raw = f.read()
+        st = os.stat(self.state_file)
+        replacement = self.state_file + ".new"
+        with open(replacement, 'wb') as f:
+            f.write(raw.replace(b"TEST-001", b"TEST-002"))
+        os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(replacement, self.state_file)
+        self.agent.load_previous_state()
+        self.assertEqual(self.agent.previous_state['claims'][0]['claim_id'], "TEST-002")
+
+        # An external rewrite of the file is picked up again
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            json.dump({"claims": [], "payouts": []}, f)
+        self.agent.load_previous_state()
+        self.assertEqual(self.agent.previous_state['claims'], [])
+
     def test_detect_expiring_claims_first_run(self):
         """Test expiring claim detection on first run."""
         # First run - no previous state
@@ -236,6 +333,31 @@ class TestClassActionClaimsAgent(unittest.TestCase):
         # Should not detect again
         self.assertEqual(len(expiring2), 0)
     
+    def test_previous_claims_deserialized_on_demand(self):
+        """Test that only previous claims matching current ones are deserialized."""
+        self.agent.current_claims = [
+            Claim(
+                claim_id=f"TEST-00{i}",
+                title="Test Claim",
+                description="Test",
+                filing_deadline=datetime.now() + timedelta(days=15),
+                claim_amount="$100",
+                category="test",
+                status="active",
+                claim_url="https://example.com"
+            )
+            for i in range(3)
+        ]
+        self.agent.save_current_state()
+
+        new_agent = ClassActionClaimsAgent(state_file=self.state_file)
+        new_agent.load_previous_state()
+        new_agent.current_claims = self.agent.current_claims[:1]
+
+        with patch.object(Claim, 'from_dict', wraps=Claim.from_dict) as from_dict:
+            self.assertEqual(new_agent.detect_expiring_claims(), [])
+            self.assertEqual(from_dict.call_count, 1)
+
     def test_detect_expired_claims_crossing_deadline(self):
         """Test detecting claims that crossed deadline between runs."""
         # First run - claim not expired yet (deadline in future)
@@ -309,7 +431,53 @@ class TestClassActionClaimsAgent(unittest.TestCase):
         
         expired2 = new_agent.detect_expired_claims()
         self.assertEqual(len(expired2), 0)  # Already notified
-    
+
+    def test_notified_expired_claims_pruned(self):
+        """Test that notified ids are dropped once their claim leaves the state."""
+        claim = Claim(
+            claim_id="TEST-001",
+            title="Test Claim",
+            description="Test",
+            filing_deadline=datetime.now() - timedelta(days=1),
+            claim_amount="$100",
+            category="test",
+            status="expired",
+            claim_url="https://example.com"
+        )
+        self.agent.current_claims = [claim]
+        self.agent.notifications = [{
+            'type': 'expired_claim',
+            'claim_id': 'TEST-001',
+            'title': 'Test Claim'
+        }]
+        self.agent.save_current_state()
+
+        new_agent = ClassActionClaimsAgent(state_file=self.state_file)
+        new_agent.load_previous_state()
+        self.assertEqual(new_agent.previous_state['notified_expired_claims'], ["TEST-001"])
+        new_agent.current_claims = []  # Claim removed from feed
+        new_agent.save_current_state()
+
+        with open(self.state_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['notified_expired_claims'], [])
+
+    def test_run_closes_notifier(self):
+        """Test that run() releases the notifier's resources when it finishes."""
+        notifier = Mock()
+        agent = ClassActionClaimsAgent(state_file=self.state_file, notifier=notifier)
+        agent.run()
+        notifier.close.assert_called_once()
+
+    def test_run_evaluates_claims_once(self):
+        """Test that detection and the summary share one expiring-soon split."""
+        agent = ClassActionClaimsAgent(state_file=self.state_file, notifier=Mock())
+        with patch.object(Claim, 'evaluate', wraps=Claim.evaluate) as mock_evaluate:
+            summary = agent.run()
+        mock_evaluate.assert_called_once()
+        expiring = [n for n in summary['notifications'] if n['type'] == 'expiring_claim']
+        # First run notifies about every claim in the window
+        self.assertEqual(summary['expiring_soon'], len(expiring))
+
     def test_detect_new_payouts(self):
         """Test new payout detection."""
         # First run - one payout
@@ -415,8 +583,7 @@ class TestEmailNotifier(unittest.TestCase):
     def test_email_notifier_send(self, mock_smtp):
         """Test sending email notifications."""
         # Setup mock SMTP
-        mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        mock_server = mock_smtp.return_value
         
         with patch.dict(os.environ, {
             'SMTP_HOST': 'smtp.example.com',
@@ -448,6 +615,36 @@ class TestEmailNotifier(unittest.TestCase):
             mock_server.starttls.assert_called_once()
             mock_server.login.assert_called_once_with('user', 'pass')
             mock_server.send_message.assert_called_once()
+
+    @patch('smtplib.SMTP')
+    def test_email_notifier_reuses_connection(self, mock_smtp):
+        """Test that consecutive sends share one SMTP connection."""
+        mock_server = mock_smtp.return_value
+
+        with patch.dict(os.environ, {
+            'SMTP_HOST': 'smtp.example.com',
+            'SMTP_FROM': 'from@example.com',
+            'SMTP_TO': 'to@example.com'
+        }):
+            notifier = EmailNotifier()
+
+            notifications = [{
+                'type': 'new_payout',
+                'title': 'Test Payout',
+                'message': 'New payout announced: $1M',
+                'announcement_date': '2026-01-14',
+                'distribution_date': 'TBD',
+                'amount': '$1M',
+                'url': 'https://example.com'
+            }]
+
+            self.assertTrue(notifier.send(notifications, {'notifications': notifications}))
+            self.assertTrue(notifier.send(notifications, {'notifications': notifications}))
+            notifier.close()
+
+            mock_smtp.assert_called_once_with('smtp.example.com', 587)
+            self.assertEqual(mock_server.send_message.call_count, 2)
+            mock_server.quit.assert_called_once()
     
     @patch('smtplib.SMTP')
     def test_email_notifier_no_send_on_empty(self, mock_smtp):
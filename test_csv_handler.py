@@ -0,0 +1,251 @@
+"""
+Unit tests for the CSV handler module
+
+Tests cover:
+- Row serialization with csv.DictWriter semantics
+- Reading into rows and columns
+- Sampled validation before writing
+"""
+
+import importlib.machinery
+import importlib.util
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+from collections import defaultdict
+
+# The handler module lives in a file without a .py suffix, so load it by path
+_HANDLER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "File 2")
+_loader = importlib.machinery.SourceFileLoader("csv_handler", _HANDLER_PATH)
+csv_handler = importlib.util.module_from_spec(importlib.util.spec_from_loader("csv_handler", _loader))
+_loader.exec_module(csv_handler)
+
+CSVHandler = csv_handler.CSVHandler
+CSVIOError = csv_handler.CSVIOError
+CSVValidationError = csv_handler.CSVValidationError
+
+
+def _quiet_logger() -> logging.Logger:
+    logger = logging.getLogger('CSVHandlerTest')
+    logger.setLevel(logging.CRITICAL)
+    return logger
+
+
+class TestRowValues(unittest.TestCase):
+    """Test that rows are serialized as csv.DictWriter would."""
+
+    def test_exact_rows(self):
+        """Test rows holding exactly the fieldnames keep fieldnames order."""
+        rows = [{'b': 2, 'a': 1}, {'a': 3, 'b': 4}]
+        self.assertEqual(
+            [list(values) for values in CSVHandler._row_values(rows, ['a', 'b'])],
+            [[1, 2], [3, 4]]
+        )
+
+    def test_missing_keys(self):
+        """Test missing keys are written as empty strings."""
+        rows = [{'a': 1}, {'b': 2, 'c': 3}]
+        self.assertEqual(
+            [list(values) for values in CSVHandler._row_values(rows, ['a', 'b', 'c'])],
+            [[1, '', ''], ['', 2, 3]]
+        )
+
+    def test_extra_keys(self):
+        """Test keys outside fieldnames raise ValueError, even at the same width."""
+        with self.assertRaises(ValueError):
+            list(CSVHandler._row_values([{'a': 1, 'x': 2}], ['a', 'b']))
+        with self.assertRaises(ValueError):
+            list(CSVHandler._row_values([{'a': 1, 'b': 2, 'x': 3}], ['a', 'b']))
+
+    def test_dict_subclass_with_missing_hook(self):
+        """Test a defaultdict is neither filled in nor allowed to hide unknown keys."""
+        row = defaultdict(str, {'a': 3, 'x': 4})
+        with self.assertRaises(ValueError):
+            list(CSVHandler._row_values([row], ['a', 'b']))
+        self.assertNotIn('b', row)
+
+        row = defaultdict(str, {'a': 3})
+        self.assertEqual(list(CSVHandler._row_values([row], ['a', 'b'])), [[3, '']])
+        self.assertNotIn('b', row)
+
+    def test_single_column(self):
+        """Test a single field still yields a one-value row."""
+        self.assertEqual(
+            [list(values) for values in CSVHandler._row_values([{'a': 1}, {}], ['a'])],
+            [[1], ['']]
+        )
+
+    def test_empty_fieldnames(self):
+        """Test rows without fields yield empty rows, and any key is unknown."""
+        self.assertEqual(list(CSVHandler._row_values([{}, {}], [])), [[], []])
+        with self.assertRaises(ValueError):
+            list(CSVHandler._row_values([{'a': 1}], []))
+
+
+class TestWriteCSV(unittest.TestCase):
+    """Test CSV writing."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_file = os.path.join(self.temp_dir, "test.csv")
+        self.handler = CSVHandler(logger=_quiet_logger(), create_backups=False)
+
+    def tearDown(self):
+        """Clean up test files."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_write_single_column(self):
+        """Test a one-column file round-trips."""
+        self.handler.write_csv(self.csv_file, [{'a': '1'}, {'a': '2'}])
+        self.assertEqual(self.handler.read_csv(self.csv_file), [{'a': '1'}, {'a': '2'}])
+
+    def test_write_unknown_key_fails(self):
+        """Test an unknown key is rejected without leaving a file behind."""
+        with self.assertRaises(CSVIOError):
+            self.handler.write_csv(
+                self.csv_file, [{'a': '1', 'b': '2'}, {'a': '3', 'x': '4'}],
+                validate_before_write=False
+            )
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+
+class TestReadCSV(unittest.TestCase):
+    """Test CSV reading."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_file = os.path.join(self.temp_dir, "test.csv")
+        self.handler = CSVHandler(logger=_quiet_logger())
+
+    def tearDown(self):
+        """Clean up test files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, text: str) -> None:
+        with open(self.csv_file, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+
+    def test_iter_csv_streams_rows(self):
+        """Test iter_csv yields rows lazily and drops surplus fields."""
+        self._write("a,b\n1,2\n3,4,5\n6\n")
+        rows = self.handler.iter_csv(self.csv_file)
+        self.assertEqual(next(rows), {'a': '1', 'b': '2'})
+        self.assertEqual(list(rows), [{'a': '3', 'b': '4'}, {'a': '6', 'b': None}])
+
+    def test_iter_csv_raises_on_iteration(self):
+        """Test iter_csv errors surface once iteration starts."""
+        rows = self.handler.iter_csv(self.csv_file)
+        with self.assertRaises(CSVIOError):
+            next(rows)
+
+    def test_iter_csv_validates_columns(self):
+        """Test iter_csv checks expected columns unless validation is skipped."""
+        self._write("a,b\n1,2\n")
+        with self.assertRaises(CSVValidationError):
+            list(self.handler.iter_csv(self.csv_file, expected_columns=['a', 'c']))
+        self.assertEqual(
+            list(self.handler.iter_csv(self.csv_file, ['a', 'c'], skip_validation=True)),
+            [{'a': '1', 'b': '2'}]
+        )
+
+    def test_read_csv_columnar(self):
+        """Test short rows are padded, surplus fields dropped and blank lines skipped."""
+        self._write("a,b,c\n1,2,3\n\n4\n5,6,7,8\n")
+        self.assertEqual(self.handler.read_csv_columnar(self.csv_file), {
+            'a': ['1', '4', '5'],
+            'b': ['2', None, '6'],
+            'c': ['3', None, '7'],
+        })
+
+    def test_read_csv_columnar_matches_read_csv(self):
+        """Test columns hold the same values read_csv returns per row."""
+        self._write('a;b\n"x;y";2\n\n3\n4;5;6\n')
+        handler = CSVHandler(logger=_quiet_logger(), delimiter=';')
+        rows = handler.read_csv(self.csv_file)
+        columns = handler.read_csv_columnar(self.csv_file)
+        self.assertEqual([dict(zip(columns, values)) for values in zip(*columns.values())], rows)
+
+    def test_read_csv_columnar_rejects_empty_header(self):
+        """Test an empty file is rejected like read_csv does."""
+        self._write("")
+        with self.assertRaises(CSVValidationError):
+            self.handler.read_csv_columnar(self.csv_file)
+        with self.assertRaises(CSVValidationError):
+            self.handler.read_csv(self.csv_file)
+
+    def test_read_csv_columnar_validates_columns(self):
+        """Test read_csv_columnar checks expected columns."""
+        self._write("a,b\n1,2\n")
+        with self.assertRaises(CSVValidationError):
+            self.handler.read_csv_columnar(self.csv_file, expected_columns=['c'])
+
+    @unittest.skipUnless(csv_handler.HAS_PYARROW, "pyarrow is not installed")
+    def test_read_csv_arrow(self):
+        """Test the pyarrow reader returns the same columns and rejects empty files."""
+        self._write("a,b\nx,y\nz,w\n")
+        table = self.handler.read_csv_arrow(self.csv_file, expected_columns=['a'])
+        self.assertEqual(table.to_pylist(), self.handler.read_csv(self.csv_file))
+        with self.assertRaises(CSVValidationError):
+            self.handler.read_csv_arrow(self.csv_file, expected_columns=['c'])
+
+        self._write("")
+        with self.assertRaises(CSVValidationError):
+            self.handler.read_csv_arrow(self.csv_file)
+
+    def test_readers_reject_missing_file(self):
+        """Test every reader raises CSVIOError for a missing path or a directory."""
+        for read in (self.handler.read_csv, self.handler.read_csv_columnar):
+            with self.assertRaises(CSVIOError):
+                read(self.csv_file)
+            with self.assertRaises(CSVIOError):
+                read(self.temp_dir)
+
+
+class TestValidationSampleSize(unittest.TestCase):
+    """Test sampled validation of rows before writing."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.data = [{'a': str(i), 'b': str(i)} for i in range(100)]
+
+    def test_full_validation_checks_every_row(self):
+        """Test that without a sample size any bad row is rejected."""
+        self.data[37] = {'a': '37', 'x': '37'}
+        with self.assertRaises(CSVValidationError):
+            CSVHandler._validate_data_structure(self.data)
+
+    def test_sample_skips_rows_between_strides(self):
+        """Test that a sample only checks evenly spaced rows."""
+        self.data[37] = {'a': '37', 'x': '37'}
+        CSVHandler._validate_data_structure(self.data, sample_size=10)
+
+    def test_sample_checks_first_strided_and_last_rows(self):
+        """Test that a sample still covers the first, every stride and the last row."""
+        for i in (0, 40, 99):
+            data = list(self.data)
+            data[i] = {'a': str(i), 'x': str(i)}
+            with self.assertRaises(CSVValidationError):
+                CSVHandler._validate_data_structure(data, sample_size=10)
+
+    def test_write_csv_uses_sample_size(self):
+        """Test write_csv validates with the handler's sample size."""
+        self.data[37] = {'a': '37', 'x': '37'}
+        handler = CSVHandler(logger=_quiet_logger(), validation_sample_size=10)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # The sample misses the bad row, so writing itself rejects it
+            with self.assertRaises(CSVIOError):
+                handler.write_csv(os.path.join(temp_dir, "test.csv"), self.data)
+
+    def test_factory_passes_sample_size(self):
+        """Test get_csv_handler configures the sample size."""
+        handler = csv_handler.get_csv_handler(log_level='CRITICAL', validation_sample_size=10)
+        self.assertEqual(handler.validation_sample_size, 10)
+        self.assertIsNone(csv_handler.get_csv_handler(log_level='CRITICAL').validation_sample_size)
+
+
+if __name__ == '__main__':
+    unittest.main()